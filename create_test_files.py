@@ -4,6 +4,11 @@
 import os
 from pathlib import Path
 
+try:  # Escrita em lote via io_uring (Linux) — opcional, fallback serial.
+    import liburing  # type: ignore
+except ImportError:
+    liburing = None
+
 # Cria pasta de teste se não existir
 test_dir = Path("test_files")
 test_dir.mkdir(exist_ok=True)
@@ -22,11 +27,61 @@ test_files = [
     ("estilo.css", "body { color: blue; }"),
 ]
 
+
+def create_files(pairs):
+    """Cria todos os arquivos de teste.
+
+    Com liburing disponível, todas as escritas entram no kernel com uma
+    única submissão de io_uring em vez de um write por arquivo; sem ela,
+    usa o loop serial tradicional.
+    """
+    if liburing is None:
+        for path, content in pairs:
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(content)
+        return
+
+    fds = []
+    buffers = []  # mantém os bytes vivos até as escritas completarem
+    ring = liburing.io_uring()
+    liburing.io_uring_queue_init(len(pairs), ring, 0)
+    try:
+        for i, (path, content) in enumerate(pairs):
+            fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            data = content.encode("utf-8")
+            fds.append(fd)
+            buffers.append(data)
+            sqe = liburing.io_uring_get_sqe(ring)
+            liburing.io_uring_prep_write(sqe, fd, data, len(data), 0)
+            sqe.user_data = i
+        liburing.io_uring_submit_and_wait(ring, len(pairs))
+        # Confere cada completion: res < 0 é errno, res curto é escrita
+        # parcial — o fallback serial teria levantado nos dois casos.
+        failures = []
+        cqe = liburing.io_uring_cqe()
+        for _ in pairs:
+            liburing.io_uring_wait_cqe(ring, cqe)
+            idx = cqe.user_data
+            if cqe.res < 0:
+                failures.append((pairs[idx][0], os.strerror(-cqe.res)))
+            elif cqe.res != len(buffers[idx]):
+                failures.append((pairs[idx][0], "escrita incompleta"))
+            liburing.io_uring_cqe_seen(ring, cqe)
+        if failures:
+            raise OSError(
+                "Falha ao criar arquivos: "
+                + "; ".join(f"{path}: {err}" for path, err in failures)
+            )
+    finally:
+        for fd in fds:
+            os.close(fd)
+        liburing.io_uring_queue_exit(ring)
+
+
 # Cria os arquivos de teste
-for filename, content in test_files:
-    file_path = test_dir / filename
-    with open(file_path, 'w', encoding='utf-8') as f:
-        f.write(content)
+pairs = [(test_dir / filename, content) for filename, content in test_files]
+create_files(pairs)
+for file_path, _ in pairs:
     print(f"Criado: {file_path}")
 
 print(f"\nArquivos de teste criados em: {test_dir.absolute()}")
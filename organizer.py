@@ -2,16 +2,36 @@
 # -*- coding: utf-8 -*-
 
 import argparse
+import errno
+import functools
+import re
 import shutil
 import sys
 import json
 import time
 import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Callable, Dict, List, Tuple, Optional
 
 import known_folders
 
+try:  # Remoção em lote via io_uring (Linux) — opcional, fallback serial.
+    import liburing  # type: ignore
+except ImportError:
+    liburing = None
+
+try:  # BLAKE3 (SIMD, libera o GIL) para verificação por hash — opcional.
+    from blake3 import blake3 as _hash_new  # type: ignore
+except ImportError:
+    from hashlib import blake2b as _hash_new
+
+try:  # Parser JSON acelerado (Rust/SIMD) — opcional, fallback stdlib.
+    import orjson  # type: ignore
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 DEFAULT_MAP = {
     "Imagens":     [".jpg", ".jpeg", ".png", ".gif", ".bmp", ".tiff", ".webp", ".svg", ".heic"],
     "Documentos":  [".pdf", ".doc", ".docx", ".txt", ".rtf", ".odt", ".csv", ".xls", ".xlsx", ".ppt", ".pptx", ".md"],
@@ -35,6 +55,21 @@ FOLDER_KEYWORDS = {
     "Design":      ["design", "art", "creative", "photoshop", "illustrator"],
 }
 
+# Um padrão compilado por categoria: a alternância roda no motor C do re,
+# e a ordem da lista preserva a precedência da tabela FOLDER_KEYWORDS.
+_FOLDER_PATTERNS: List[Tuple[str, "re.Pattern[str]"]] = [
+    (category, re.compile("|".join(map(re.escape, keywords))))
+    for category, keywords in FOLDER_KEYWORDS.items()
+]
+
+# Abaixo deste número de arquivos a cópia é serial — criar threads para
+# meia dúzia de copy2 custa mais do que economiza.
+PARALLEL_COPY_THRESHOLD = 4
+
+# Profundidade da fila do io_uring para remoções em lote (~128 é o ponto
+# ótimo: lotes maiores não amortizam mais nada e só aumentam latência).
+UNLINK_QUEUE_DEPTH = 128
+
 _config_cache: Dict[str, Dict[str, List[str]]] = {}
 
 
@@ -49,54 +84,92 @@ def load_map(config_path: Optional[Path] = None) -> Dict[str, List[str]]:
 
     if config_path.exists():
         try:
-            with config_path.open("r", encoding="utf-8") as f:
-                data = json.load(f)
-            normalized = {
-                k: [e.lower() if e.startswith(".") else f".{e.lower()}" for e in v]
-                for k, v in data.items()
-            }
+            data = _json_loads(config_path.read_bytes())
+            # Normaliza e já constrói o índice invertido na mesma passada,
+            # evitando uma segunda varredura no primeiro guess_folder.
+            normalized: Dict[str, List[str]] = {}
+            index: Dict[str, str] = {}
+            for folder, exts in data.items():
+                norm = [e.lower() if e.startswith(".") else f".{e.lower()}" for e in exts]
+                normalized[folder] = norm
+                for ext in norm:
+                    index.setdefault(ext, folder)
+            _ext_index_cache[id(normalized)] = (normalized, index)
             _config_cache[config_key] = normalized
             return normalized
-        except (json.JSONDecodeError, IOError) as e:
+        except (ValueError, IOError) as e:
             print(f"Erro ao carregar configuração: {e}")
             return DEFAULT_MAP
 
     return DEFAULT_MAP
 
 
+_ext_index_cache: Dict[int, Tuple[Dict[str, List[str]], Dict[str, str]]] = {}
+
+
+def _ext_index(ext_map: Dict[str, List[str]]) -> Dict[str, str]:
+    """Inverte ext_map em um dict extensão → pasta para lookup O(1).
+
+    O cache guarda uma referência ao próprio ext_map junto do índice, de
+    modo que a chave id() nunca possa colidir com um mapa já coletado.
+    """
+    cached = _ext_index_cache.get(id(ext_map))
+    if cached is not None and cached[0] is ext_map:
+        return cached[1]
+
+    index: Dict[str, str] = {}
+    for folder, exts in ext_map.items():
+        for ext in exts:
+            index.setdefault(ext, folder)  # primeira categoria prevalece
+
+    _ext_index_cache[id(ext_map)] = (ext_map, index)
+    return index
+
+
 def guess_folder(ext: str, ext_map: Dict[str, List[str]], unknown_name: str) -> str:
     """Determina em qual pasta o arquivo deve ser colocado baseado na extensão."""
-    ext = ext.lower()
-    for folder, exts in ext_map.items():
-        if ext in exts:
-            return folder
-    return unknown_name
+    return _ext_index(ext_map).get(ext.lower(), unknown_name)
 
 
+@functools.lru_cache(maxsize=4096)
 def guess_folder_type(folder_name: str, unknown_name: str) -> str:
-    """Determina o tipo de pasta baseado em palavras-chave no nome."""
+    """Determina o tipo de pasta baseado em palavras-chave no nome.
+
+    O resultado é memoizado (argumentos são strings hasháveis e
+    FOLDER_KEYWORDS é constante) — reexecuções sobre os mesmos nomes de
+    pasta saem do cache sem repetir a varredura de palavras-chave.
+    """
     folder_lower = folder_name.lower()
-    for category, keywords in FOLDER_KEYWORDS.items():
-        for keyword in keywords:
-            if keyword in folder_lower:
-                return category
+    for category, pattern in _FOLDER_PATTERNS:
+        if pattern.search(folder_lower):
+            return category
     return unknown_name
 
 
 def analyze_folder_content(folder_path: Path, ext_map: Dict[str, List[str]], max_files: int = 50) -> str:
-    """Analisa o conteúdo de uma pasta para determinar sua categoria predominante."""
+    """Analisa o conteúdo de uma pasta para determinar sua categoria predominante.
+
+    Usa os.scandir — is_file sai do d_type em cache do readdir, sem um stat
+    por item — e encerra cedo quando os primeiros arquivos já dão um sinal
+    forte (≥3 na mesma categoria dentro dos 5 primeiros), evitando varrer
+    pastas grandes até max_files.
+    """
     file_types: Dict[str, int] = {}
     file_count = 0
 
     try:
-        for item_name in os.listdir(folder_path):
-            if file_count >= max_files:
-                break
-            item_path = folder_path / item_name
-            if item_path.is_file():
-                category = guess_folder(item_path.suffix.lower(), ext_map, "Outros")
+        with os.scandir(folder_path) as entries:
+            for entry in entries:
+                if file_count >= max_files:
+                    break
+                if not entry.is_file(follow_symlinks=False):
+                    continue
+                ext = os.path.splitext(entry.name)[1]
+                category = guess_folder(ext, ext_map, "Outros")
                 file_types[category] = file_types.get(category, 0) + 1
                 file_count += 1
+                if file_count >= 5 and max(file_types.values()) >= 3:
+                    break
     except (PermissionError, OSError):
         return "Outros"
 
@@ -106,9 +179,164 @@ def analyze_folder_content(folder_path: Path, ext_map: Dict[str, List[str]], max
     return max(file_types, key=file_types.get)
 
 
+def _fast_copy(src, dst) -> None:  # aceita Path ou str
+    """Copia src → dst preferindo os.copy_file_range quando disponível.
+
+    copy_file_range copia (ou clona, em Btrfs/XFS com reflink) os blocos
+    dentro do kernel, sem transitar os bytes pelo espaço de usuário. Em
+    plataformas ou filesystems sem suporte, cai no shutil.copy2.
+    """
+    # Como shutil.copyfile: abrir dst em "wb" truncaria o próprio src antes
+    # do primeiro byte ser lido se os dois apontarem para o mesmo arquivo.
+    try:
+        same = os.path.samefile(src, dst)
+    except OSError:
+        same = False  # dst ainda não existe
+    if same:
+        raise shutil.SameFileError(f"{src} e {dst} são o mesmo arquivo")
+    if not hasattr(os, "copy_file_range"):
+        shutil.copy2(src, dst)
+        return
+    try:
+        with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+            remaining = os.fstat(fsrc.fileno()).st_size
+            while remaining > 0:
+                copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                if copied == 0:
+                    break
+                remaining -= copied
+    except OSError as e:
+        if e.errno in (errno.ENOSYS, errno.EXDEV, errno.EINVAL, errno.EOPNOTSUPP):
+            shutil.copy2(src, dst)
+            return
+        raise
+    shutil.copystat(src, dst)  # preserva mtime/permissões como o copy2
+
+
+def _copy_tree(src: Path, dst: Path, max_workers: int = 4) -> None:
+    """Copia uma árvore de diretórios mesclando com o destino existente.
+
+    Substitui shutil.copytree(dirs_exist_ok=True): um único os.walk coleta
+    diretórios e arquivos, os diretórios são criados sequencialmente
+    (barato) e as cópias de arquivo rodam em paralelo via _fast_copy —
+    copytree é serial e não consegue sobrepor I/O em árvores grandes.
+    """
+    src_str = str(src)
+    dirs: List[Tuple[str, str]] = [(src_str, str(dst))]
+    files: List[Tuple[str, str]] = []
+    # followlinks reproduz o copytree(symlinks=False) substituído: symlinks
+    # para diretórios viram diretórios reais com o conteúdo copiado. O set
+    # de realpaths já visitados impede loops em ciclos de symlink.
+    seen = {os.path.realpath(src_str)}
+    for root, dirnames, filenames in os.walk(src_str, followlinks=True):
+        dst_root = os.path.join(str(dst), os.path.relpath(root, src_str)) \
+            if root != src_str else str(dst)
+        pruned = []
+        for d in dirnames:
+            real = os.path.realpath(os.path.join(root, d))
+            if real in seen:
+                continue
+            seen.add(real)
+            pruned.append(d)
+            dirs.append((os.path.join(root, d), os.path.join(dst_root, d)))
+        dirnames[:] = pruned
+        for f in filenames:
+            files.append((os.path.join(root, f), os.path.join(dst_root, f)))
+
+    for _, dst_dir in dirs:
+        os.makedirs(dst_dir, exist_ok=True)
+
+    if len(files) > PARALLEL_COPY_THRESHOLD:
+        with ThreadPoolExecutor(max_workers=max_workers) as ex:
+            futures = [ex.submit(_fast_copy, s, d) for s, d in files]
+            for fut in as_completed(futures):
+                fut.result()  # propaga a primeira exceção
+    else:
+        for s, d in files:
+            _fast_copy(s, d)
+
+    for src_dir, dst_dir in dirs:
+        shutil.copystat(src_dir, dst_dir)
+
+
+def _transfer_file(src, dst, want_digest: bool) -> Optional[bytes]:
+    """Copia src → dst e, se pedido, hasheia o original recém-lido.
+
+    Função de módulo (picklável) para poder ser submetida tanto ao
+    ThreadPoolExecutor quanto ao ProcessPoolExecutor.
+    """
+    _fast_copy(src, dst)
+    if want_digest:
+        return _file_digest(str(src))
+    return None
+
+
+def _file_digest(path: str) -> bytes:
+    """Hash do conteúdo de um arquivo (BLAKE3 se instalado, senão BLAKE2b)."""
+    h = _hash_new()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            h.update(block)
+    return h.digest()
+
+
+def _batch_unlink(paths: List[str]) -> List[Tuple[str, Optional[str]]]:
+    """Remove arquivos, submetendo unlinks em lote via io_uring se disponível.
+
+    Com liburing, cada lote de até UNLINK_QUEUE_DEPTH unlinkat's entra no
+    kernel com um único io_uring_submit_and_wait em vez de um syscall por
+    arquivo. Sem liburing (não-Linux ou não instalado), remove serialmente.
+
+    Retorna [(path, erro_ou_None), ...] na ordem de submissão.
+    """
+    if liburing is None:
+        results: List[Tuple[str, Optional[str]]] = []
+        for path in paths:
+            try:
+                os.unlink(path)
+                results.append((path, None))
+            except OSError as e:
+                results.append((path, str(e)))
+        return results
+
+    results = [(path, None) for path in paths]
+    ring = liburing.io_uring()
+    liburing.io_uring_queue_init(UNLINK_QUEUE_DEPTH, ring, 0)
+    try:
+        cqe = liburing.io_uring_cqe()
+        for start in range(0, len(paths), UNLINK_QUEUE_DEPTH):
+            chunk = paths[start:start + UNLINK_QUEUE_DEPTH]
+            # mantém os bytes vivos até a submissão ser consumida pelo kernel
+            encoded = [os.fsencode(path) for path in chunk]
+            for idx, raw in enumerate(encoded):
+                sqe = liburing.io_uring_get_sqe(ring)
+                liburing.io_uring_prep_unlinkat(sqe, raw)
+                sqe.user_data = start + idx
+            liburing.io_uring_submit_and_wait(ring, len(chunk))
+            for _ in chunk:
+                liburing.io_uring_wait_cqe(ring, cqe)
+                pos = cqe.user_data
+                if cqe.res < 0:
+                    results[pos] = (paths[pos], os.strerror(-cqe.res))
+                liburing.io_uring_cqe_seen(ring, cqe)
+    finally:
+        liburing.io_uring_queue_exit(ring)
+    return results
+
+
+def _same_device(src_dev: int, target_dir: Path) -> bool:
+    """True se target_dir está no mesmo filesystem (st_dev) que a origem."""
+    try:
+        return target_dir.stat().st_dev == src_dev
+    except OSError:
+        return False
+
+
+@functools.lru_cache(maxsize=1024)
 def human(n: int) -> str:
     """Formata número com separadores de milhares (pt-BR)."""
-    return f"{n:,}".replace(",", ".")
+    # "_" como separador evita a consulta de locale do formato ",".
+    return f"{n:_}".replace("_", ".")
 
 
 def organize(
@@ -123,6 +351,10 @@ def organize(
     progress_cb: Optional[Callable[[int, int], None]] = None,
     use_system_libraries: bool = False,
     system_paths_override: Optional[Dict[str, Path]] = None,
+    max_workers: int = 4,
+    verify_hash: bool = False,
+    executor: str = "thread",
+    log_callback: Optional[Callable[[str], None]] = None,
 ) -> Tuple[str, int, int, int]:
     """
     Organiza arquivos da pasta source para dest_root baseado nas extensões.
@@ -136,6 +368,19 @@ def organize(
     system_paths_override:
         Mapeamento categoria → Path usado exclusivamente em testes para evitar
         dependência de caminhos reais do sistema operacional.
+    max_workers:
+        Número de threads usadas para copiar arquivos em paralelo quando o
+        lote é grande o suficiente para compensar o overhead das threads.
+    verify_hash:
+        Quando True, o modo move (entre filesystems) confere também o hash
+        do conteúdo antes de remover os originais, não apenas o tamanho.
+    executor:
+        "thread" (padrão) ou "process". Threads bastam para cópia pura
+        (I/O libera o GIL); processos compensam quando verify_hash domina
+        o tempo de CPU em lotes grandes.
+    log_callback:
+        Chamado com cada linha de log conforme é produzida — permite à GUI
+        exibir o andamento sem reprocessar o relatório final.
 
     Returns
     -------
@@ -144,180 +389,305 @@ def organize(
     moved = skipped = errors = 0
     logs: List[str] = []
 
-    # Rastreia (original, destino_real) para verificação antes de deletar
-    files_to_remove: List[Tuple[Path, Path]] = []
-    folders_to_remove: List[Tuple[Path, Path]] = []
-
     if not source.exists() or not source.is_dir():
         raise RuntimeError(f"Pasta de origem inválida: {source}")
 
-    dest_root.mkdir(parents=True, exist_ok=True)
+    # Com log_path definido, cada linha vai direto para o arquivo conforme é
+    # produzida — o page cache do SO absorve o buffering e o relatório não
+    # precisa ser regravado inteiro no final.
+    log_fh = None
+    log_file: Optional[Path] = None
+    if log_path:
+        log_path.parent.mkdir(parents=True, exist_ok=True)
+        ts = time.strftime("%Y-%m-%d_%H-%M-%S")
+        log_file = log_path.parent / f"{log_path.stem}_{ts}{log_path.suffix}"
+        log_fh = log_file.open("w", buffering=1 << 20, encoding="utf-8")
 
-    def _resolve_target_dir(category: str) -> Path:
-        """Retorna o diretório de destino para uma categoria."""
+    def _emit(line: str) -> None:
+        logs.append(line)
+        if log_callback:
+            log_callback(line)
+        if log_fh:
+            log_fh.write(line + "\n")
+
+    try:
+        # Rastreia (original, destino_real, tamanho) para verificação antes de
+        # deletar — caminhos como str e tamanho do stat da primeira passada, de
+        # modo que a segunda passada só itera tuplas e chama os.stat, sem
+        # reconstruir Path nem reclassificar nada. O hash só é preenchido com
+        # verify_hash ativo.
+        files_to_remove: List[Tuple[str, str, int, Optional[bytes]]] = []
+        folders_to_remove: List[Tuple[Path, Path]] = []
+
+        # Cópias de arquivos planejadas na primeira passada e executadas em lote
+        # (em paralelo quando o lote compensa o overhead das threads).
+        copy_plan: List[Tuple[Path, Path, int]] = []
+
+        dest_root.mkdir(parents=True, exist_ok=True)
+
+        # Mover dentro do mesmo filesystem vira um rename atômico (só metadados,
+        # zero cópia de bytes) — dispensa a dança copiar+verificar+remover.
+        # O resultado é cacheado por diretório de destino, pois no modo
+        # bibliotecas cada categoria pode estar em um volume diferente.
+        source_dev = source.stat().st_dev
+        same_dev_cache: Dict[str, bool] = {}
+
+        # Só há ~uma dúzia de pastas de categoria — um mkdir por arquivo é
+        # desperdício de syscall; garante cada diretório uma única vez.
+        created_dirs: set = set()
+
+        def _ensure_dir(target_dir: Path) -> None:
+            key = str(target_dir)
+            if key not in created_dirs:
+                target_dir.mkdir(parents=True, exist_ok=True)
+                created_dirs.add(key)
+
+        def _resolve_target_dir(category: str) -> Path:
+            """Retorna o diretório de destino para uma categoria."""
+            if use_system_libraries:
+                target = known_folders.resolve_category_path(
+                    category, source, dest_root, system_paths_override
+                )
+                # Segurança: se o destino resolvido for dentro da origem
+                # (exceto source/Programas que é intencional), usa fallback.
+                try:
+                    target.relative_to(source)
+                    if category not in known_folders.PROGRAMAS_IN_SOURCE:
+                        _emit(
+                            f"[AVISO] Destino resolvido para dentro da origem "
+                            f"({category}). Usando dest_root como fallback."
+                        )
+                        return dest_root / category
+                except ValueError:
+                    pass  # não está dentro de source — ok
+                return target
+            return dest_root / category
+
+        # Snapshot dos itens antes de criar subpastas de destino.
+        # os.scandir reutiliza os metadados do readdir (d_type), evitando um
+        # stat extra por item que Path.iterdir() + Path.is_dir() custariam.
+        with os.scandir(source) as it:
+            source_items = list(it)
+        total_items = len(source_items)
+        category_names = set(ext_map.keys()) | {unknown_name}
+
+        # No modo bibliotecas, a pasta source/Programas é destino — nunca mover
         if use_system_libraries:
-            target = known_folders.resolve_category_path(
-                category, source, dest_root, system_paths_override
-            )
-            # Segurança: se o destino resolvido for dentro da origem
-            # (exceto source/Programas que é intencional), usa fallback.
-            try:
-                target.relative_to(source)
-                if category not in known_folders.PROGRAMAS_IN_SOURCE:
-                    logs.append(
-                        f"[AVISO] Destino resolvido para dentro da origem "
-                        f"({category}). Usando dest_root como fallback."
-                    )
-                    return dest_root / category
-            except ValueError:
-                pass  # não está dentro de source — ok
-            return target
-        return dest_root / category
-
-    # Snapshot dos itens antes de criar subpastas de destino
-    source_items = list(source.iterdir())
-    total_items = len(source_items)
-    category_names = set(ext_map.keys()) | {unknown_name}
-
-    # No modo bibliotecas, a pasta source/Programas é destino — nunca mover
-    if use_system_libraries:
-        category_names |= known_folders.PROGRAMAS_IN_SOURCE
-
-    # --- Primeira passada: copia tudo ---
-    for item_idx, p in enumerate(source_items):
-        if progress_cb:
-            progress_cb(item_idx + 1, total_items)
-        if p.is_dir():
-            if p.name in category_names:
-                continue  # não mover pastas de categoria para dentro de si mesmas
+            category_names |= known_folders.PROGRAMAS_IN_SOURCE
 
-            try:
-                target_folder = guess_folder_type(p.name, unknown_name)
-                if target_folder == unknown_name:
-                    target_folder = analyze_folder_content(p, ext_map)
+        # --- Primeira passada: copia tudo ---
+        for item_idx, entry in enumerate(source_items):
+            if progress_cb:
+                progress_cb(item_idx + 1, total_items)
 
-                target_dir = _resolve_target_dir(target_folder)
-                target_dir.mkdir(parents=True, exist_ok=True)
+            # Nome antes de qualquer syscall: em re-execuções sobre uma origem já
+            # organizada a maior parte das entradas é pasta de categoria, e o
+            # is_dir só é consultado para os poucos nomes que batem.
+            if entry.name in category_names and entry.is_dir(follow_symlinks=False):
+                continue  # não mover pastas de categoria para dentro de si mesmas
 
-                target_path = target_dir / p.name
+            if entry.is_dir(follow_symlinks=False):
+                p = Path(entry.path)
+                try:
+                    target_folder = guess_folder_type(p.name, unknown_name)
+                    if target_folder == unknown_name:
+                        target_folder = analyze_folder_content(p, ext_map)
+
+                    target_dir = _resolve_target_dir(target_folder)
+                    _ensure_dir(target_dir)
+
+                    target_path = target_dir / p.name
+                    counter = 1
+                    p_resolved: Optional[Path] = None  # resolvido uma única vez
+                    while target_path.exists():
+                        if p_resolved is None:
+                            p_resolved = p.resolve()
+                        if target_path.resolve() == p_resolved:
+                            break
+                        target_path = target_dir / f"{p.name} ({counter})"
+                        counter += 1
+
+                    if dry_run:
+                        action = "COPIAR" if mode == "copy" else "MOVER"
+                        _emit(f"[DRY-RUN] {action} PASTA: {p.name} -> {target_path}")
+                    else:
+                        _copy_tree(p, target_path, max_workers=max_workers)
+                        _emit(f"[OK] COPIAR PASTA: {p.name} -> {target_path}")
+                        moved += 1
+                        if mode == "move":
+                            folders_to_remove.append((p, target_path))
+
+                except Exception as e:
+                    _emit(f"[ERRO] PASTA {p.name}: {e}")
+                    errors += 1
+                continue
+
+            suffix = os.path.splitext(entry.name)[1]
+            if entry.name.startswith(".") and suffix == "":  # arquivos ocultos sem extensão
+                skipped += 1
+                continue
+
+            p = Path(entry.path)
+            target_folder = guess_folder(suffix, ext_map, unknown_name)
+            target_dir = _resolve_target_dir(target_folder)
+            _ensure_dir(target_dir)
+
+            target_path = target_dir / p.name
+            if target_path.exists() and target_path.resolve() != p.resolve():
+                # prefixo pré-montado: evita normalizar um Path novo por candidato
+                prefix = os.path.join(str(target_dir), p.stem)
+                ext = p.suffix
+                p_resolved = p.resolve()
                 counter = 1
-                while target_path.exists() and target_path.resolve() != p.resolve():
-                    target_path = target_dir / f"{p.name} ({counter})"
+                candidate = f"{prefix} ({counter}){ext}"
+                while os.path.lexists(candidate):
+                    if Path(candidate).resolve() == p_resolved:
+                        break
                     counter += 1
+                    candidate = f"{prefix} ({counter}){ext}"
+                target_path = Path(candidate)
 
-                if dry_run:
-                    action = "COPIAR" if mode == "copy" else "MOVER"
-                    logs.append(f"[DRY-RUN] {action} PASTA: {p.name} -> {target_path}")
-                else:
-                    shutil.copytree(p, target_path, dirs_exist_ok=True)
-                    logs.append(f"[OK] COPIAR PASTA: {p.name} -> {target_path}")
-                    moved += 1
-                    if mode == "move":
-                        folders_to_remove.append((p, target_path))
-
-            except Exception as e:
-                logs.append(f"[ERRO] PASTA {p.name}: {e}")
-                errors += 1
-            continue
-
-        if p.name.startswith(".") and p.suffix == "":  # arquivos ocultos sem extensão
-            skipped += 1
-            continue
-
-        target_folder = guess_folder(p.suffix, ext_map, unknown_name)
-        target_dir = _resolve_target_dir(target_folder)
-        target_dir.mkdir(parents=True, exist_ok=True)
-
-        target_path = target_dir / p.name
-        counter = 1
-        while target_path.exists() and target_path.resolve() != p.resolve():
-            target_path = target_dir / f"{p.stem} ({counter}){p.suffix}"
-            counter += 1
-
-        try:
             if dry_run:
                 action = "COPIAR" if mode == "copy" else "MOVER"
-                logs.append(f"[DRY-RUN] {action}: {p.name} -> {target_path}")
+                _emit(f"[DRY-RUN] {action}: {p.name} -> {target_path}")
+            elif mode == "move":
+                dir_key = str(target_dir)
+                same_dev = same_dev_cache.get(dir_key)
+                if same_dev is None:
+                    same_dev = _same_device(source_dev, target_dir)
+                    same_dev_cache[dir_key] = same_dev
+
+                if same_dev:
+                    # rename atômico: já está no destino, nada a verificar/remover
+                    try:
+                        os.replace(p, target_path)
+                        _emit(f"[OK] MOVER: {p.name} -> {target_path}")
+                        moved += 1
+                    except Exception as e:
+                        _emit(f"[ERRO] {p.name}: {e}")
+                        errors += 1
+                else:
+                    # outro dispositivo: copiar, verificar e só então remover
+                    copy_plan.append((p, target_path, entry.stat().st_size))
             else:
-                shutil.copy2(p, target_path)
-                logs.append(f"[OK] COPIAR: {p.name} -> {target_path}")
+                copy_plan.append((p, target_path, 0))  # modo copy: sem verificação
+
+        # --- Executa as cópias planejadas ---
+        # Lotes pequenos não amortizam o custo de criar workers; acima do limiar,
+        # a cópia é I/O-bound e libera o GIL, então escala com threads. Para
+        # cargas com hash pesado (verify-hash em muitos arquivos), processos
+        # evitam o GIL ao custo de pickling por tarefa.
+        # Os mkdir já aconteceram na fase de planejamento (serial) — sem corrida.
+        want_digest = verify_hash and mode == "move"
+
+        def _finish_copy(
+            src: Path, dst: Path, size: int,
+            digest: Optional[bytes], exc: Optional[BaseException],
+        ) -> None:
+            nonlocal moved, errors
+            if exc is None:
+                _emit(f"[OK] COPIAR: {src.name} -> {dst}")
                 moved += 1
                 if mode == "move":
-                    files_to_remove.append((p, target_path))
-        except Exception as e:
-            logs.append(f"[ERRO] {p.name}: {e}")
-            errors += 1
+                    files_to_remove.append((str(src), str(dst), size, digest))
+            else:
+                _emit(f"[ERRO] {src.name}: {exc}")
+                errors += 1
 
-    # --- Segunda passada: verifica e remove originais (modo move) ---
-    if mode == "move" and not dry_run and (files_to_remove or folders_to_remove):
-        if errors > 0:
-            logs.append("")
-            logs.append("[AVISO] Houve erros na organização. Originais mantidos por segurança.")
+        if len(copy_plan) > PARALLEL_COPY_THRESHOLD:
+            executor_cls = (
+                ProcessPoolExecutor if executor == "process" else ThreadPoolExecutor
+            )
+            with executor_cls(max_workers=max_workers) as ex:
+                futures = {
+                    ex.submit(_transfer_file, src, dst, want_digest): (src, dst, size)
+                    for src, dst, size in copy_plan
+                }
+                for fut in as_completed(futures):
+                    src, dst, size = futures[fut]
+                    exc = fut.exception()
+                    _finish_copy(src, dst, size, None if exc else fut.result(), exc)
         else:
-            logs.append("")
-            logs.append("Verificando organização...")
-            all_verified = True
-
-            for original, target in files_to_remove:
-                if not target.exists():
-                    logs.append(f"[ERRO] Arquivo não encontrado no destino: {target}")
-                    all_verified = False
-                elif original.stat().st_size != target.stat().st_size:
-                    logs.append(f"[ERRO] Tamanhos divergem: {original.name}")
-                    all_verified = False
-
-            for original, target in folders_to_remove:
-                if not target.exists():
-                    logs.append(f"[ERRO] Pasta não encontrada no destino: {target}")
-                    all_verified = False
-
-            if all_verified:
-                logs.append("Verificação OK. Removendo originais...")
-                for original, _ in files_to_remove:
-                    try:
-                        original.unlink()
-                        logs.append(f"[OK] REMOVER: {original.name}")
-                    except Exception as e:
-                        logs.append(f"[ERRO] Falha ao remover {original.name}: {e}")
-                        errors += 1
+            for src, dst, size in copy_plan:
+                try:
+                    digest = _transfer_file(src, dst, want_digest)
+                except Exception as e:
+                    _finish_copy(src, dst, size, None, e)
+                else:
+                    _finish_copy(src, dst, size, digest, None)
 
-                for original, _ in folders_to_remove:
-                    try:
-                        shutil.rmtree(original)
-                        logs.append(f"[OK] REMOVER PASTA: {original.name}")
-                    except Exception as e:
-                        logs.append(f"[ERRO] Falha ao remover pasta {original.name}: {e}")
-                        errors += 1
+        # --- Segunda passada: verifica e remove originais (modo move) ---
+        if mode == "move" and not dry_run and (files_to_remove or folders_to_remove):
+            if errors > 0:
+                _emit("")
+                _emit("[AVISO] Houve erros na organização. Originais mantidos por segurança.")
             else:
-                logs.append("[AVISO] Verificação falhou. Originais mantidos por segurança.")
-                errors += 1
+                _emit("")
+                _emit("Verificando organização...")
+                all_verified = True
 
-    # Remove subpastas vazias se solicitado
-    if delete_empty and not dry_run:
-        for d in source.iterdir():
-            if d.is_dir():
-                try:
-                    next(d.iterdir())
-                except StopIteration:
-                    d.rmdir()
-
-    summary = (
-        f"Processados: {human(moved + skipped + errors)} | "
-        f"organizados: {human(moved)} | "
-        f"pulados: {human(skipped)} | "
-        f"erros: {human(errors)}"
-    )
-    logs.append("")
-    logs.append(summary)
+                for original, target, src_size, src_digest in files_to_remove:
+                    try:
+                        dst_size = os.stat(target).st_size  # um único stat por arquivo
+                    except OSError:
+                        _emit(f"[ERRO] Arquivo não encontrado no destino: {target}")
+                        all_verified = False
+                        continue
+                    if dst_size != src_size:
+                        _emit(f"[ERRO] Tamanhos divergem: {os.path.basename(original)}")
+                        all_verified = False
+                    elif src_digest is not None and _file_digest(target) != src_digest:
+                        _emit(f"[ERRO] Hash diverge: {os.path.basename(original)}")
+                        all_verified = False
+
+                for original, target in folders_to_remove:
+                    if not target.exists():
+                        _emit(f"[ERRO] Pasta não encontrada no destino: {target}")
+                        all_verified = False
+
+                if all_verified:
+                    _emit("Verificação OK. Removendo originais...")
+                    for original, err in _batch_unlink([orig for orig, _, _, _ in files_to_remove]):
+                        if err is None:
+                            _emit(f"[OK] REMOVER: {os.path.basename(original)}")
+                        else:
+                            _emit(f"[ERRO] Falha ao remover {os.path.basename(original)}: {err}")
+                            errors += 1
+
+                    for original, _ in folders_to_remove:
+                        try:
+                            shutil.rmtree(original)
+                            _emit(f"[OK] REMOVER PASTA: {original.name}")
+                        except Exception as e:
+                            _emit(f"[ERRO] Falha ao remover pasta {original.name}: {e}")
+                            errors += 1
+                else:
+                    _emit("[AVISO] Verificação falhou. Originais mantidos por segurança.")
+                    errors += 1
 
-    output = "\n".join(logs)
+        # Remove subpastas vazias se solicitado
+        if delete_empty and not dry_run:
+            for d in source.iterdir():
+                if d.is_dir():
+                    try:
+                        next(d.iterdir())
+                    except StopIteration:
+                        d.rmdir()
+
+        summary = (
+            f"Processados: {human(moved + skipped + errors)} | "
+            f"organizados: {human(moved)} | "
+            f"pulados: {human(skipped)} | "
+            f"erros: {human(errors)}"
+        )
+        _emit("")
+        _emit(summary)
+    finally:
+        if log_fh:
+            log_fh.close()
 
-    if log_path:
-        log_path.parent.mkdir(parents=True, exist_ok=True)
-        ts = time.strftime("%Y-%m-%d_%H-%M-%S")
-        log_file = log_path.parent / f"{log_path.stem}_{ts}{log_path.suffix}"
-        with log_file.open("w", encoding="utf-8") as f:
-            f.write(output)
+    output = "\n".join(logs)
+    if log_file:
         output += f"\nLog salvo em: {log_file}"
 
     return output, moved, skipped, errors
@@ -363,6 +733,14 @@ Exemplos:
                     help="Arquivo JSON com mapeamento extensão -> pasta")
     ap.add_argument("--log",
                     help="Caminho do arquivo de log (ex.: logs/organizer.log)")
+    ap.add_argument("--workers", type=int, default=4,
+                    help="Workers para copiar arquivos em paralelo (padrão: 4)")
+    ap.add_argument("--executor", choices=("thread", "process"), default="thread",
+                    help="Tipo de worker: threads (padrão) ou processos — útil "
+                         "com --verify-hash em lotes grandes")
+    ap.add_argument("--verify-hash", action="store_true",
+                    help="No modo move entre discos, confere o hash do conteúdo "
+                         "(não só o tamanho) antes de remover os originais")
     ap.add_argument("--system-folders", action="store_true",
                     help=(
                         "Envia arquivos para as bibliotecas reais do Windows "
@@ -400,6 +778,9 @@ Exemplos:
             source, dest, args.mode, args.dry_run, args.delete_empty,
             args.unknown_name, ext_map, log_path,
             use_system_libraries=args.system_folders and known_folders.is_available(),
+            max_workers=args.workers,
+            verify_hash=args.verify_hash,
+            executor=args.executor,
         )
 
         print(report)
@@ -5,10 +5,10 @@
 from __future__ import annotations
 
 import json
-import queue
 import sys
 import threading
 import tkinter as tk
+from collections import deque
 from pathlib import Path
 from tkinter import filedialog, messagebox
 from typing import Dict, List, Optional
@@ -39,6 +39,11 @@ from theme import (
 PROJECT_ROOT = Path(__file__).resolve().parent
 ICON_PATH = PROJECT_ROOT / "assets" / "organizer.ico"
 MAX_RECENT = 8
+_DOWNLOADS = Path.home() / "Downloads"  # Path.home() lê env vars; resolve 1x
+
+# DEFAULT_MAP é constante: serializa uma vez no import em vez de a cada
+# clique em "Ver config padrão".
+_DEFAULT_MAP_JSON = json.dumps(DEFAULT_MAP, indent=2, ensure_ascii=False)
 
 
 # ---------------------------------------------------------------------------
@@ -106,18 +111,29 @@ class OrganizerApp(ctk.CTk):
         self._apply_window_icon()
 
         self.source_path = tk.StringVar()
+        # Path da origem mantido em cache via trace: o worker lê o objeto
+        # pronto em vez de reparsear a string a cada organização.
+        self._source_path_obj: Optional[Path] = None
+        self.source_path.trace_add("write", self._on_source_path_write)
         self.dest_path = tk.StringVar()
         self.mode = tk.StringVar(value="move")
         self.dry_run = tk.BooleanVar(value=True)
         self.delete_empty = tk.BooleanVar(value=False)
         self.use_system_libraries = tk.BooleanVar(value=False)
         self.unknown_name = tk.StringVar(value="Outros")
+        self.executor = tk.StringVar(value="thread")
         self.config_path = tk.StringVar()
 
         self._recent_src: List[str] = []
         self._recent_dst: List[str] = []
-
-        self.log_queue: queue.Queue = queue.Queue()
+        self._config_window: Optional[ctk.CTkToplevel] = None
+
+        # deque sem lock: um produtor (worker) e um consumidor (loop Tk);
+        # append/popleft são atômicos no CPython.
+        self.log_queue: deque = deque()
+        self.max_log_lines = 5000  # teto do Text: insert fica O(1) no tempo
+        self._drain_scheduled = False  # deduplica o after(0) de _post
+        self._drain_lock = threading.Lock()
         self.is_organizing = False
         self._stop_event = threading.Event()
 
@@ -129,10 +145,13 @@ class OrganizerApp(ctk.CTk):
 
         self._build_ui()
         self._bind_shortcuts()
-        self._poll_log_queue()
 
     # ------------------------------------------------------------------ infra
 
+    def _on_source_path_write(self, *_args) -> None:
+        raw = self.source_path.get()
+        self._source_path_obj = Path(raw) if raw else None
+
     def _c(self, key: str) -> str:
         return palette(self.theme_name)[key]
 
@@ -282,6 +301,19 @@ class OrganizerApp(ctk.CTk):
 
     # ---- pastas -----------------------------------------------------------
 
+    # Paddings por coluna (rótulo, campo, botão) das linhas dos cards.
+    _GRID_COLS = (
+        {"padx": (0, SPACING["sm"]), "sticky": "w"},
+        {"padx": SPACING["xs"], "sticky": "ew"},
+        {"padx": (SPACING["xs"], 0)},
+    )
+
+    def _grid_row(self, row: int, *widgets) -> None:
+        """Posiciona uma linha rótulo/campo/botão com os paddings padrão,
+        em vez de repetir os mesmos kwargs em cada chamada de grid."""
+        for col, (widget, kwargs) in enumerate(zip(widgets, self._GRID_COLS)):
+            widget.grid(row=row, column=col, pady=SPACING["sm"], **kwargs)
+
     def _build_paths_card(self, parent) -> None:
         card = self._card(parent, "Pastas")
 
@@ -307,7 +339,6 @@ class OrganizerApp(ctk.CTk):
             body, text="Config JSON", font=FONT["label"],
             text_color=self._pair("text_muted"), anchor="w", width=90,
         )
-        label.grid(row=2, column=0, padx=(0, SPACING["sm"]), pady=SPACING["sm"], sticky="w")
         self._themed_register(label, text_color="text_muted")
 
         cfg_entry = ctk.CTkEntry(
@@ -321,13 +352,12 @@ class OrganizerApp(ctk.CTk):
             border_color=self._pair("input_border"),
             placeholder_text="Opcional — arquivo JSON de categorias personalizadas",
         )
-        cfg_entry.grid(row=2, column=1, padx=SPACING["xs"], pady=SPACING["sm"], sticky="ew")
         self._themed_register(cfg_entry, fg_color="input_bg", text_color="text", border_color="input_border")
 
         cfg_btn = self._secondary_button(
             body, "Procurar", self._browse_config, tip="Selecionar arquivo JSON de mapeamento",
         )
-        cfg_btn.grid(row=2, column=2, padx=(SPACING["xs"], 0), pady=SPACING["sm"])
+        self._grid_row(2, label, cfg_entry, cfg_btn)
 
     def _add_path_row(
         self, parent, row: int, label_text: str,
@@ -341,7 +371,6 @@ class OrganizerApp(ctk.CTk):
             anchor="w",
             width=90,
         )
-        label.grid(row=row, column=0, padx=(0, SPACING["sm"]), pady=SPACING["sm"], sticky="w")
         self._themed_register(label, text_color="text_muted")
 
         combo = ctk.CTkComboBox(
@@ -360,7 +389,6 @@ class OrganizerApp(ctk.CTk):
             dropdown_text_color=self._pair("text"),
             dropdown_hover_color=self._pair("bg_alt"),
         )
-        combo.grid(row=row, column=1, padx=SPACING["xs"], pady=SPACING["sm"], sticky="ew")
         self._themed_register(
             combo,
             fg_color="input_bg", text_color="text", border_color="input_border",
@@ -370,7 +398,7 @@ class OrganizerApp(ctk.CTk):
         )
 
         btn = self._primary_button(parent, "Procurar", cmd, tip=tip_text, width=110)
-        btn.grid(row=row, column=2, padx=(SPACING["xs"], 0), pady=SPACING["sm"])
+        self._grid_row(row, label, combo, btn)
         return combo
 
     # ---- opções -----------------------------------------------------------
@@ -428,6 +456,50 @@ class OrganizerApp(ctk.CTk):
         mode_tip.pack(side="left", padx=SPACING["md"])
         self._themed_register(mode_tip, text_color="text_muted")
 
+        # Execução (threads x processos)
+        exec_row = ctk.CTkFrame(body, fg_color="transparent")
+        exec_row.pack(fill="x", pady=(0, SPACING["md"]))
+
+        exec_label = ctk.CTkLabel(
+            exec_row, text="Execução", font=FONT["label"],
+            text_color=self._pair("text_muted"), anchor="w", width=90,
+        )
+        exec_label.pack(side="left")
+        self._themed_register(exec_label, text_color="text_muted")
+
+        exec_seg = ctk.CTkSegmentedButton(
+            exec_row,
+            values=["Threads", "Processos"],
+            height=34,
+            corner_radius=RADIUS["button"],
+            font=FONT["label"],
+            fg_color=self._pair("bg_alt"),
+            selected_color=self._pair("primary"),
+            selected_hover_color=self._pair("primary_hover"),
+            unselected_color=self._pair("bg_alt"),
+            unselected_hover_color=self._pair("divider"),
+            text_color=self._pair("text"),
+            command=self._on_executor_change,
+        )
+        exec_seg.set("Threads")
+        exec_seg.pack(side="left", padx=SPACING["sm"])
+        self._themed_register(
+            exec_seg,
+            fg_color="bg_alt",
+            selected_color="primary",
+            selected_hover_color="primary_hover",
+            unselected_color="bg_alt",
+            unselected_hover_color="divider",
+            text_color="text",
+        )
+        self._executor_segment = exec_seg
+        _Tooltip(
+            exec_seg,
+            "Threads bastam para cópia pura; processos aceleram\n"
+            "a verificação por hash em lotes grandes.",
+            self._tooltips_palette,
+        )
+
         # Toggles (switches)
         toggles = ctk.CTkFrame(body, fg_color="transparent")
         toggles.pack(fill="x", pady=(0, SPACING["md"]))
@@ -515,6 +587,9 @@ class OrganizerApp(ctk.CTk):
     def _on_mode_change(self, value: str) -> None:
         self.mode.set("copy" if value == "Copiar" else "move")
 
+    def _on_executor_change(self, value: str) -> None:
+        self.executor.set("process" if value == "Processos" else "thread")
+
     def _on_system_libraries_toggle(self) -> None:
         enabled = self.use_system_libraries.get() and known_folders.is_available()
         state = "disabled" if enabled else "normal"
@@ -799,33 +874,77 @@ class OrganizerApp(ctk.CTk):
 
     # ------------------------------------------------------------------ log queue
 
-    def _poll_log_queue(self) -> None:
+    def _post(self, item) -> None:
+        """Enfileira um item de log/progresso e agenda o drain no loop Tk.
+
+        Substitui o polling de 100 ms: a UI só acorda quando há algo a
+        exibir, e uma rajada de mensagens compartilha um único after(0).
+        """
+        self.log_queue.append(item)
+        with self._drain_lock:
+            if self._drain_scheduled:
+                return
+            self._drain_scheduled = True
+        self.after(0, self._drain_log_queue)
+
+    def _drain_log_queue(self) -> None:
+        # Limpa a flag antes de drenar: puts que chegarem durante o drain
+        # reagendam; no pior caso o wakeup extra encontra a fila vazia.
+        with self._drain_lock:
+            self._drain_scheduled = False
+        lines: List[tuple] = []  # (mensagem, tag) acumuladas nesta drenagem
+        latest_progress: Optional[tuple] = None  # só o último valor interessa
         try:
             while True:
-                item = self.log_queue.get_nowait()
+                item = self.log_queue.popleft()
                 if (
                     isinstance(item, tuple)
                     and len(item) == 3
                     and item[0] == "_progress"
                 ):
-                    _, current, total = item
-                    pct = (current / total) if total else 1.0
-                    self.progress_var.set(pct)
-                    self.progress_bar.set(pct)
-                    self.pct_label.configure(text=f"{int(pct * 100)}%")
-                    self.status_label.configure(
-                        text=f"Processando {current} de {total}…"
-                    )
+                    latest_progress = item
                 else:
-                    self._log(str(item))
-        except queue.Empty:
+                    msg = str(item)
+                    lines.append((msg, self._tag_for(msg)))
+        except IndexError:
             pass
-        self.after(100, self._poll_log_queue)
+        if latest_progress is not None:
+            _, current, total = latest_progress
+            pct = (current / total) if total else 1.0
+            self.progress_var.set(pct)
+            self.progress_bar.set(pct)
+            self.pct_label.configure(text=f"{int(pct * 100)}%")
+            self.status_label.configure(
+                text=f"Processando {current} de {total}…"
+            )
+        if lines:
+            self._log_batch(lines)
 
     def _log(self, message: str) -> None:
-        tag = self._tag_for(message)
+        self._log_batch([(message, self._tag_for(message))])
+
+    def _log_batch(self, lines: List[tuple]) -> None:
+        """Insere linhas agrupando sequências consecutivas com a mesma tag.
+
+        Um insert por grupo (e um único see ao final) em vez de dois
+        round-trips Tcl por linha — relatórios grandes chegam inteiros em
+        uma drenagem e o re-layout do Text é amortizado.
+        """
         inner = self.log_text._textbox  # type: ignore[attr-defined]
-        inner.insert("end", message + "\n", tag)
+        buf: List[str] = []
+        current_tag = lines[0][1]
+        for msg, tag in lines:
+            if tag != current_tag:
+                inner.insert("end", "\n".join(buf) + "\n", current_tag)
+                buf = []
+                current_tag = tag
+            buf.append(msg)
+        inner.insert("end", "\n".join(buf) + "\n", current_tag)
+        # Ring buffer: descarta as linhas mais antigas acima do teto para a
+        # B-tree do Text não crescer (e o insert não degradar) em runs longos.
+        total = int(inner.index("end-1c").split(".")[0])
+        if total > self.max_log_lines:
+            inner.delete("1.0", f"{total - self.max_log_lines}.0")
         inner.see("end")
 
     def _tag_for(self, line: str) -> str:
@@ -895,17 +1014,44 @@ class OrganizerApp(ctk.CTk):
             filetypes=[("Texto", "*.txt"), ("Todos", "*.*")],
         )
         if path:
+            self._write_async(path, content, "Log salvo em:")
+
+    def _write_async(self, path: str, content: str, success_msg: str) -> None:
+        """Escreve o arquivo em uma thread daemon para não travar o mainloop.
+
+        O write (e eventual fsync) de um log grande bloquearia a UI; o
+        messagebox de resultado volta para a thread principal via after(0).
+        """
+        def _do_write() -> None:
             try:
                 Path(path).write_text(content, encoding="utf-8")
-                messagebox.showinfo("Sucesso", f"Log salvo em:\n{path}")
             except Exception as e:
-                messagebox.showerror("Erro", f"Não foi possível salvar:\n{e}")
+                # Captura a mensagem já formatada: a variável do except é
+                # apagada ao sair do bloco, antes do after(0) executar.
+                msg = f"Não foi possível salvar:\n{e}"
+                self.after(0, lambda: messagebox.showerror("Erro", msg))
+            else:
+                self.after(0, lambda: messagebox.showinfo(
+                    "Sucesso", f"{success_msg}\n{path}"))
+
+        threading.Thread(target=_do_write, daemon=True).start()
 
     def _show_default_config(self) -> None:
+        # Reutiliza a janela (withdraw/deiconify): criar os widgets de novo
+        # a cada clique custa dezenas de chamadas Tcl.
+        if self._config_window is not None:
+            self._config_window.deiconify()
+            self._config_window.lift()
+            return
         win = ctk.CTkToplevel(self)
+        self._config_window = win
+        win.protocol("WM_DELETE_WINDOW", win.withdraw)
         win.title("Configuração padrão de extensões")
         win.geometry("720x520")
         win.configure(fg_color=self._c("bg"))
+        # Janela cacheada: registra os widgets para o toggle de tema
+        # repintá-los como faz com o resto da UI.
+        self._themed_register(win, fg_color="bg")
         try:
             if sys.platform == "win32" and ICON_PATH.exists():
                 win.after(200, lambda: win.iconbitmap(str(ICON_PATH)))
@@ -917,8 +1063,9 @@ class OrganizerApp(ctk.CTk):
             font=FONT["title"], text_color=self._c("text"),
         )
         header.pack(pady=(SPACING["md"], SPACING["sm"]))
+        self._themed_register(header, text_color="text")
 
-        config_json = json.dumps(DEFAULT_MAP, indent=2, ensure_ascii=False)
+        config_json = _DEFAULT_MAP_JSON
         txt = ctk.CTkTextbox(
             win,
             font=FONT["log"],
@@ -930,6 +1077,7 @@ class OrganizerApp(ctk.CTk):
                  padx=SPACING["lg"], pady=SPACING["sm"])
         txt.insert("1.0", config_json)
         txt.configure(state="disabled")
+        self._themed_register(txt, fg_color="log_bg", text_color="log_fg")
 
         footer = ctk.CTkFrame(win, fg_color="transparent")
         footer.pack(fill="x", padx=SPACING["lg"], pady=SPACING["md"])
@@ -944,15 +1092,17 @@ class OrganizerApp(ctk.CTk):
             text_color="#ffffff",
         )
         save_btn.pack(side="right")
+        self._themed_register(save_btn, fg_color="success", hover_color="success_hover")
 
         close_btn = ctk.CTkButton(
-            footer, text="Fechar", command=win.destroy,
+            footer, text="Fechar", command=win.withdraw,
             font=FONT["button"], height=40, width=120,
             corner_radius=RADIUS["button"],
             fg_color=self._c("neutral"), hover_color=self._c("neutral_hover"),
             text_color="#ffffff",
         )
         close_btn.pack(side="right", padx=SPACING["xs"])
+        self._themed_register(close_btn, fg_color="neutral", hover_color="neutral_hover")
 
     def _save_config_file(self, config_json: str) -> None:
         path = filedialog.asksaveasfilename(
@@ -961,18 +1111,14 @@ class OrganizerApp(ctk.CTk):
             filetypes=[("JSON", "*.json"), ("Todos", "*.*")],
         )
         if path:
-            try:
-                Path(path).write_text(config_json, encoding="utf-8")
-                messagebox.showinfo("Sucesso", f"Configuração salva em:\n{path}")
-            except Exception as e:
-                messagebox.showerror("Erro", f"Não foi possível salvar:\n{e}")
+            self._write_async(path, config_json, "Configuração salva em:")
 
     # ------------------------------------------------------------------ organizar
 
     def _cancel(self) -> None:
         if self.is_organizing:
             self._stop_event.set()
-            self.log_queue.put("⚠️  Operação cancelada pelo usuário.")
+            self._post("⚠️  Operação cancelada pelo usuário.")
             self._set_ui_state(organizing=False)
 
     def _set_ui_state(self, *, organizing: bool) -> None:
@@ -1013,66 +1159,74 @@ class OrganizerApp(ctk.CTk):
 
     def _organize_worker(self) -> None:
         try:
-            source = Path(self.source_path.get())
+            # Snapshot das variáveis Tk: cada .get() é um round-trip Tcl e,
+            # vindo de um worker, ainda serializa contra a thread principal.
+            source = self._source_path_obj or Path(self.source_path.get())
             use_sys = self.use_system_libraries.get() and known_folders.is_available()
             dest_raw = self.dest_path.get().strip()
+            mode = self.mode.get()
+            dry_run = self.dry_run.get()
+            delete_empty = self.delete_empty.get()
+            unknown_name = self.unknown_name.get()
+            executor = self.executor.get()
+            cfg_raw = self.config_path.get()
             if use_sys and not dest_raw:
                 dest = source
             else:
                 dest = Path(dest_raw)
-            cfgp = Path(self.config_path.get()) if self.config_path.get() else None
+            cfgp = Path(cfg_raw) if cfg_raw else None
             ext_map = load_map(cfgp)
 
             sep = "=" * 55
-            self.log_queue.put(sep)
-            self.log_queue.put("Iniciando organização...")
-            self.log_queue.put(f"Origem:  {source}")
+            self._post(sep)
+            self._post("Iniciando organização...")
+            self._post(f"Origem:  {source}")
             if use_sys:
-                self.log_queue.put("Destino: bibliotecas do sistema (Documentos, Imagens, …)")
+                self._post("Destino: bibliotecas do sistema (Documentos, Imagens, …)")
             else:
-                self.log_queue.put(f"Destino: {dest}")
-            self.log_queue.put(
-                f"Modo:    {'Mover' if self.mode.get() == 'move' else 'Copiar'}"
+                self._post(f"Destino: {dest}")
+            self._post(
+                f"Modo:    {'Mover' if mode == 'move' else 'Copiar'}"
             )
-            if self.dry_run.get():
-                self.log_queue.put("*** MODO TESTE — nenhum arquivo será alterado ***")
-            self.log_queue.put(sep)
+            if dry_run:
+                self._post("*** MODO TESTE — nenhum arquivo será alterado ***")
+            self._post(sep)
 
             def progress_cb(current: int, total: int) -> None:
-                self.log_queue.put(("_progress", current, total))
+                self._post(("_progress", current, total))
+
+            def log_cb(line: str) -> None:
+                if line.strip():
+                    self._post(line)
 
-            report, moved, skipped, errors = organize(
+            _, moved, skipped, errors = organize(
                 source=source,
                 dest_root=dest,
-                mode=self.mode.get(),
-                dry_run=self.dry_run.get(),
-                delete_empty=self.delete_empty.get(),
-                unknown_name=self.unknown_name.get(),
+                mode=mode,
+                dry_run=dry_run,
+                delete_empty=delete_empty,
+                unknown_name=unknown_name,
                 ext_map=ext_map,
                 progress_cb=progress_cb,
-                use_system_libraries=(
-                    self.use_system_libraries.get() and known_folders.is_available()
-                ),
+                use_system_libraries=use_sys,
+                executor=executor,
+                log_callback=log_cb,
             )
 
-            for line in report.split("\n"):
-                if line.strip():
-                    self.log_queue.put(line)
-
             total_count = moved + skipped + errors
             self.after(
                 0, lambda: self._update_stats(total_count, moved, skipped, errors)
             )
 
             if errors > 0:
-                self.log_queue.put(f"⚠️  Concluído com {errors} erro(s).")
+                self._post(f"⚠️  Concluído com {errors} erro(s).")
             elif moved > 0:
-                self.log_queue.put(f"✅  {moved} item(ns) organizados com sucesso!")
+                self._post(f"✅  {moved} item(ns) organizados com sucesso!")
             else:
-                self.log_queue.put("ℹ️  Nenhum item foi processado.")
+                self._post("ℹ️  Nenhum item foi processado.")
 
         except Exception as e:
-            self.log_queue.put(f"❌  Erro: {e}")
+            self._post(f"❌  Erro: {e}")
         finally:
             self.after(0, lambda: (self.progress_var.set(1.0),
                                    self.progress_bar.set(1.0),
@@ -1088,9 +1242,8 @@ class OrganizerApp(ctk.CTk):
 def main() -> None:
     app = OrganizerApp()
 
-    downloads = Path.home() / "Downloads"
-    if downloads.is_dir():
-        src = str(downloads)
+    if _DOWNLOADS.is_dir():
+        src = str(_DOWNLOADS)
         app.source_path.set(src)
         app.dest_path.set(src)
         app._push_recent(src, app._recent_src, app._src_combo)
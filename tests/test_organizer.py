@@ -5,6 +5,7 @@ from pathlib import Path
 
 from organizer import (
     DEFAULT_MAP,
+    PARALLEL_COPY_THRESHOLD,
     analyze_folder_content,
     guess_folder,
     guess_folder_type,
@@ -191,6 +192,26 @@ class TestOrganizeCopy:
         assert (imagens / "foto.jpg").exists()
         assert (imagens / "foto (1).jpg").exists()
 
+    @pytest.mark.parametrize("executor", ["thread", "process"])
+    def test_many_files_copied_in_parallel(self, tmp_path, executor):
+        """Acima do limiar as cópias passam pelo pool de workers."""
+        names = [f"foto_{i}.jpg" for i in range(PARALLEL_COPY_THRESHOLD + 4)]
+        for name in names:
+            (tmp_path / name).write_bytes(name.encode())
+        _, moved, _, errors = self._run(tmp_path, executor=executor)
+        assert errors == 0 and moved == len(names)
+        for name in names:
+            assert (tmp_path / "Imagens" / name).read_bytes() == name.encode()
+
+    def test_copy_onto_itself_keeps_content(self, tmp_path):
+        """Organizar uma pasta de categoria sobre si mesma não pode truncar."""
+        imagens = tmp_path / "Imagens"
+        imagens.mkdir()
+        (imagens / "foto.jpg").write_bytes(b"conteudo original")
+        _, moved, _, errors = self._run(imagens, dest_root=tmp_path)
+        assert errors == 1 and moved == 0
+        assert (imagens / "foto.jpg").read_bytes() == b"conteudo original"
+
     def test_dest_root_different_from_source(self, tmp_path):
         src = tmp_path / "origem"
         dst = tmp_path / "destino"
@@ -239,6 +260,49 @@ class TestOrganizeMove:
         assert (imagens / "foto (1).jpg").exists()
         assert not (tmp_path / "foto.jpg").exists()  # original removido
 
+    @pytest.mark.parametrize("executor", ["thread", "process"])
+    def test_many_files_moved_cross_device_in_parallel(self, tmp_path, executor):
+        """Move entre dispositivos acima do limiar usa o pool de workers."""
+        from unittest.mock import patch
+        names = [f"foto_{i}.jpg" for i in range(PARALLEL_COPY_THRESHOLD + 4)]
+        for name in names:
+            (tmp_path / name).write_bytes(name.encode())
+        with patch("organizer._same_device", return_value=False):
+            _, moved, _, errors = self._run(tmp_path, executor=executor)
+        assert errors == 0 and moved == len(names)
+        for name in names:
+            assert (tmp_path / "Imagens" / name).read_bytes() == name.encode()
+            assert not (tmp_path / name).exists()  # original removido
+
+    def test_cross_device_fallback_copies_and_verifies(self, tmp_path):
+        """Quando o rename não é possível, usa copiar+verificar+remover."""
+        from unittest.mock import patch
+        (tmp_path / "foto.jpg").write_bytes(b"img")
+        with patch("organizer._same_device", return_value=False):
+            _, moved, _, errors = self._run(tmp_path)
+        assert errors == 0 and moved == 1
+        assert (tmp_path / "Imagens" / "foto.jpg").exists()
+        assert not (tmp_path / "foto.jpg").exists()
+
+    def test_verify_hash_move_succeeds(self, tmp_path):
+        from unittest.mock import patch
+        (tmp_path / "foto.jpg").write_bytes(b"img-data")
+        with patch("organizer._same_device", return_value=False):
+            _, moved, _, errors = self._run(tmp_path, verify_hash=True)
+        assert errors == 0 and moved == 1
+        assert (tmp_path / "Imagens" / "foto.jpg").exists()
+        assert not (tmp_path / "foto.jpg").exists()
+
+    def test_verify_hash_mismatch_keeps_original(self, tmp_path):
+        """Hash divergente entre origem e destino aborta a remoção."""
+        from unittest.mock import patch
+        (tmp_path / "foto.jpg").write_bytes(b"img-data")
+        with patch("organizer._same_device", return_value=False), \
+             patch("organizer._file_digest", side_effect=[b"aaa", b"bbb"]):
+            _, _, _, errors = self._run(tmp_path, verify_hash=True)
+        assert errors > 0
+        assert (tmp_path / "foto.jpg").exists()  # original preservado
+
     def test_delete_empty_removes_empty_subdir(self, tmp_path):
         empty = tmp_path / "pasta_vazia"
         empty.mkdir()
@@ -273,11 +337,21 @@ class TestOrganizeEdgeCases:
         with pytest.raises(RuntimeError, match="inválida"):
             organize(tmp_path / "nao_existe", tmp_path, "copy", False, False, "Outros", DEFAULT_MAP)
 
-    def test_move_aborts_if_copy_had_errors(self, tmp_path):
-        """Se houve erro na cópia, originais não devem ser removidos."""
+    def test_move_aborts_if_transfer_had_errors(self, tmp_path):
+        """Se houve erro ao mover, o original deve permanecer intacto."""
+        from unittest.mock import patch
+        (tmp_path / "foto.jpg").write_bytes(b"img")
+        with patch("os.replace", side_effect=OSError("permission denied")):
+            _, moved, _, errors = organize(tmp_path, tmp_path, "move", False, False, "Outros", DEFAULT_MAP)
+        assert errors > 0
+        assert (tmp_path / "foto.jpg").exists()  # original não removido
+
+    def test_move_cross_device_copy_had_errors(self, tmp_path):
+        """No fallback entre filesystems, erro na cópia mantém os originais."""
         from unittest.mock import patch
         (tmp_path / "foto.jpg").write_bytes(b"img")
-        with patch("shutil.copy2", side_effect=OSError("permission denied")):
+        with patch("organizer._same_device", return_value=False), \
+             patch("organizer._fast_copy", side_effect=OSError("permission denied")):
             _, moved, _, errors = organize(tmp_path, tmp_path, "move", False, False, "Outros", DEFAULT_MAP)
         assert errors > 0
         assert (tmp_path / "foto.jpg").exists()  # original não removido
@@ -298,6 +372,23 @@ class TestOrganizeEdgeCases:
         assert (tmp_path / "Imagens" / "fotos_viagem").exists()
         assert subdir.exists()  # original mantido
 
+    def test_folder_copy_follows_dir_symlinks(self, tmp_path):
+        """Symlink para diretório dentro da pasta tem o conteúdo copiado."""
+        dados = tmp_path / "dados_externos"
+        dados.mkdir()
+        (dados / "praia.jpg").write_bytes(b"img")
+        src = tmp_path / "origem"
+        src.mkdir()
+        pasta = src / "fotos_viagem"
+        pasta.mkdir()
+        (pasta / "capa.jpg").write_bytes(b"img")
+        (pasta / "link_dados").symlink_to(dados, target_is_directory=True)
+        _, _, _, errors = organize(src, src, "copy", False, False, "Outros", DEFAULT_MAP)
+        assert errors == 0
+        destino = src / "Imagens" / "fotos_viagem"
+        assert (destino / "capa.jpg").exists()
+        assert (destino / "link_dados" / "praia.jpg").exists()
+
     def test_folder_dry_run(self, tmp_path):
         subdir = tmp_path / "fotos_viagem"
         subdir.mkdir()